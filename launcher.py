@@ -7,107 +7,542 @@ import ssl
 import http.client
 import urllib.request
 import urllib.parse
+import base64
 import hashlib
+import hmac
+import mmap
 import zipfile
+import gzip
 import time
 import logging
+import logging.handlers
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import sys
 import subprocess
 import shutil
+from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import certifi
+except ImportError:
+    certifi = None
+
+try:
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+except ImportError:
+    InvalidSignature = Ed25519PublicKey = None
+
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+SEGMENT_MIN_SIZE = 32 << 20
+MAX_SEGMENTS = 8
+UPDATE_DOWNLOAD_WORKERS = 4
+RESUME_SAVE_INTERVAL = 16 << 20
+DOWNLOAD_ATTEMPTS = 3
+SMALL_FILE_SIZE = 8 << 20
+# На 32-битной сборке многогигабайтный файл целиком не отобразить — хешируем окнами
+MMAP_WINDOW = 512 << 20 if sys.maxsize < 2 ** 32 else 0
+PROGRESS_FLUSH_MS = 100
+SEARCH_DEBOUNCE_MS = 150
+CARD_SPACING = 16
+CARD_OVERSCAN = 2
+PROGRESS_REPORT_BYTES = 256 << 10
+PROGRESS_REPORT_INTERVAL = 0.1
+INSTALL_MARKER = ".installed.json"
+REQUEST_RETRIES = 3
+# Таймаут сокета (секунды): зависший сервер не должен держать поток и блокировку обработчика вечно
+REQUEST_TIMEOUT = 30
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = (502, 503, 504)
+EXTRACT_BUFFER_SIZE = 1 << 20
+# Порядок выбора из словаря checksums: сначала стойкие, затем быстрые некриптографические
+CHECKSUM_PREFERENCE = ('blake3', 'sha512', 'sha256', 'sha1', 'md5', 'xxh3_128', 'xxh3_64')
+# Открытый ключ Ed25519 (base64, 32 байта) для подписи обновлений лаунчера.
+# Пока ключ не задан, обновление проверяется только контрольной суммой; с ключом подпись обязательна
+UPDATE_PUBLIC_KEY = ""
+
+def _new_hasher(algo: str = 'md5'):
+    """Создать хешер по имени алгоритма из checksum_algo (md5, sha256, blake3, xxh3_64...)"""
+    if algo == 'blake3':
+        if blake3 is None:
+            raise ValueError(f"Unsupported checksum algorithm: {algo}")
+        return blake3.blake3()
+    if algo.startswith('xxh'):
+        if xxhash is None or not hasattr(xxhash, algo):
+            raise ValueError(f"Unsupported checksum algorithm: {algo}")
+        return getattr(xxhash, algo)()
+    return hashlib.new(algo)
+
+class _MultiHasher:
+    """Хешер контрольной суммы плюс дополнительные алгоритмы (SHA-256 для подписи) за один проход"""
+    def __init__(self, algo: str, extra_algos=()):
+        self.main = _new_hasher(algo)
+        self.extra = {name: self.main if name == algo else _new_hasher(name) for name in extra_algos}
+
+    def update(self, data) -> None:
+        self.main.update(data)
+        for name, hasher in self.extra.items():
+            if hasher is not self.main:
+                hasher.update(data)
+
+    def hexdigest(self) -> str:
+        return self.main.hexdigest()
+
+    def digests(self) -> Dict[str, bytes]:
+        return {name: hasher.digest() for name, hasher in self.extra.items()}
+
+def _hasher_available(algo: str) -> bool:
+    if algo == 'blake3':
+        return blake3 is not None
+    if algo.startswith('xxh'):
+        return xxhash is not None and hasattr(xxhash, algo)
+    return algo in hashlib.algorithms_available
+
+def _algorithms_available(*algos: str) -> bool:
+    """Проверить алгоритмы до загрузки, чтобы не узнать о неподдерживаемом уже после неё"""
+    for algo in algos:
+        if not _hasher_available(algo):
+            logging.error("Unsupported checksum algorithm: %s", algo)
+            return False
+    return True
+
+def pick_checksum(info: Dict, optional: bool = False) -> Tuple[Optional[str], str]:
+    """Контрольная сумма и алгоритм для записи games.json/update.json.
+
+    Из словаря checksums берётся самый стойкий алгоритм, доступный в этой установке;
+    без него — старые поля checksum и checksum_algo. Алгоритм, который здесь не поддерживается,
+    — ValueError. Отсутствие суммы допустимо только при optional (обновление лаунчера со своей
+    проверкой подписи): игру без проверки ставить нельзя.
+    """
+    checksums = info.get('checksums') or {}
+    for algo in CHECKSUM_PREFERENCE:
+        if checksums.get(algo) and _hasher_available(algo):
+            return checksums[algo], algo
+    checksum = info.get('checksum') or None
+    algo = info.get('checksum_algo', 'md5')
+    if checksum is None:
+        if checksums:
+            raise ValueError(f"No supported checksum algorithm among: {', '.join(checksums)}")
+        if not optional:
+            raise ValueError("No checksum to verify the download")
+    elif not _hasher_available(algo):
+        raise ValueError(f"Unsupported checksum algorithm: {algo}")
+    return checksum, algo
+
+def _hash_file(file_path: Path, hasher) -> None:
+    """Дописать содержимое файла в уже созданный хешер"""
+    size = file_path.stat().st_size
+    # Маленький файл читаем целиком — один вызов update без цикла
+    if size < SMALL_FILE_SIZE:
+        hasher.update(file_path.read_bytes())
+        return
+    
+    with open(file_path, "rb", buffering=0) as f:
+        _advise_sequential(f)
+        # Отдаём хешеру весь файл одним буфером (или несколькими окнами), без цикла на стороне Python
+        window = MMAP_WINDOW or size
+        offset = 0
+        try:
+            while offset < size:
+                length = min(window, size - offset)
+                with mmap.mmap(f.fileno(), length, offset=offset, access=mmap.ACCESS_READ) as mm:
+                    hasher.update(mm)
+                offset += length
+            return
+        except (ValueError, OSError, OverflowError):
+            pass  # Не хватает адресного пространства под отображение
+        
+        # Дочитываем то, что не удалось отобразить, одним переиспользуемым буфером
+        f.seek(offset)
+        buf = bytearray(DOWNLOAD_CHUNK_SIZE)
+        view = memoryview(buf)
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            hasher.update(view[:n])
+
+class _ProgressReporter:
+    """Прореживает вызовы callback: раз в report_bytes байт или report_interval секунд"""
+    def __init__(self, callback, total: int, report_bytes: int = PROGRESS_REPORT_BYTES,
+                 report_interval: float = PROGRESS_REPORT_INTERVAL):
+        self.callback = callback
+        self.total = total
+        self.report_bytes = report_bytes
+        self.report_interval = report_interval
+        self._last_done = 0
+        self._last_time = 0.0
+        self._last_percent = -1
+
+    def report(self, done: int) -> None:
+        if not self.callback or not self.total:
+            return
+        now = time.monotonic()
+        if done < self.total and done - self._last_done < self.report_bytes \
+                and now - self._last_time < self.report_interval:
+            return
+        self._last_done = done
+        self._last_time = now
+        # Одинаковый процент повторно не отправляем — экран от этого не изменится
+        percent = done * 100 // self.total
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.callback(percent)
+
+def _format_size(size) -> str:
+    """Размер file_size из update.json (в байтах) для показа в МБ"""
+    return f"{float(size or 0) / (1 << 20):.1f} MB"
+
+def _preallocate(f, size: int) -> None:
+    """Сразу выделить место под весь файл, чтобы он не рос по мегабайту за запись"""
+    try:
+        os.posix_fallocate(f.fileno(), 0, size)
+        return
+    except (AttributeError, OSError):
+        pass  # Windows или файловая система без fallocate
+    f.truncate(size)
+
+def _advise_sequential(f) -> None:
+    """Подсказать ядру, что файл будет читаться последовательно (только POSIX)"""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+def verify_signature(digest: bytes, signature, public_key: Optional[str] = None) -> bool:
+    """Проверить Ed25519-подпись (base64) над SHA-256 файла, посчитанным при загрузке.
+
+    По умолчанию — ключом UPDATE_PUBLIC_KEY.
+    """
+    if Ed25519PublicKey is None:
+        logging.error("cryptography is not installed, cannot verify update signature")
+        return False
+    if not isinstance(signature, str) or not digest:
+        return False  # Подписи нет (например, "signature": null)
+    
+    try:
+        key = Ed25519PublicKey.from_public_bytes(base64.b64decode(public_key or UPDATE_PUBLIC_KEY))
+        key.verify(base64.b64decode(signature), digest)
+        return True
+    except (InvalidSignature, ValueError):
+        return False
+
+def digest_matches(hasher, expected: str) -> bool:
+    """Сравнить hex-дайджест с ожидаемым за постоянное время (регистр hex не важен)"""
+    return hmac.compare_digest(hasher.hexdigest().encode(), expected.strip().lower().encode())
+
+# SHA-256 отпечатки (hex) DER-сертификатов, которым доверяем для хоста. Пустой набор — без привязки.
+# Перед выпуском сюда кладут отпечаток текущего сертификата сервера обновлений и следующего на замену.
+# По http к привязанному хосту не подключаемся: список игр и загрузки с него тогда тоже должны идти по https
+CERT_PINS: Dict[str, frozenset] = {}
+
+_ssl_contexts: Dict[bool, ssl.SSLContext] = {}
+
+def _ssl_context(verify: bool) -> ssl.SSLContext:
+    """SSL-контекст на весь процесс: хранилище сертификатов разбирается один раз"""
+    context = _ssl_contexts.get(verify)
+    if context is None:
+        # С certifi набор корневых сертификатов одинаковый на всех машинах
+        context = ssl.create_default_context(cafile=certifi.where() if certifi and verify else None)
+        if not verify:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        context = _ssl_contexts.setdefault(verify, context)
+    return context
 
 class SecureRequestHandler:
+    _DEFAULT_HEADERS = {'Connection': 'keep-alive'}
+    _GZIP_HEADERS = {'Accept-Encoding': 'gzip'}
+
     def __init__(self, base_url: str, verify_ssl: bool = True):
+        # Базовый адрес разбираем один раз, в запросе к нему только дописывается путь
         self.base_url = base_url.rstrip('/')
+        parsed = urllib.parse.urlsplit(self.base_url)
+        self._scheme = parsed.scheme
+        self._netloc = parsed.netloc
+        self._base_path = parsed.path
+        self._base_target = (parsed.path or '/') + ('?' + parsed.query if parsed.query else '')
         self.verify_ssl = verify_ssl
-        self.context = ssl.create_default_context()
-        if not verify_ssl:
-            self.context.check_hostname = False
-            self.context.verify_mode = ssl.CERT_NONE
-
-    def _make_request(self, endpoint: str, method: str = 'GET', headers: Dict = None, data: bytes = None) -> Tuple[int, bytes]:
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        parsed = urllib.parse.urlparse(url)
         
-        try:
-            if parsed.scheme == 'https':
-                conn = http.client.HTTPSConnection(parsed.netloc, context=self.context)
+        # Одно keep-alive соединение на хост, чтобы не платить за TCP/TLS на каждый запрос
+        self._conn = None
+        self._conn_key = None
+        self._lock = threading.Lock()
+
+    def _get_connection(self, scheme: str, netloc: str):
+        if self._conn is None or self._conn_key != (scheme, netloc):
+            self.close()
+            if scheme == 'https':
+                self._conn = http.client.HTTPSConnection(netloc, timeout=REQUEST_TIMEOUT,
+                                                         context=_ssl_context(self.verify_ssl))
             else:
-                conn = http.client.HTTPConnection(parsed.netloc)
-            
-            path = parsed.path
-            if parsed.query:
-                path += '?' + parsed.query
+                self._conn = http.client.HTTPConnection(netloc, timeout=REQUEST_TIMEOUT)
+            self._conn_key = (scheme, netloc)
+        return self._conn
+
+    def _check_pin(self, conn) -> None:
+        cert = conn.sock.getpeercert(binary_form=True)
+        if hashlib.sha256(cert).hexdigest() not in CERT_PINS[conn.host]:
+            raise ssl.SSLError(f"Certificate of {conn.host} does not match the pinned fingerprint")
+
+    def _connect(self, endpoint: str, method: str, headers: Dict, data: bytes):
+        path = f"{self._base_path}/{endpoint.lstrip('/')}" if endpoint else self._base_target
+        headers = {**self._DEFAULT_HEADERS, **headers} if headers else self._DEFAULT_HEADERS
+        
+        for attempt in range(2):
+            conn = self._get_connection(self._scheme, self._netloc)
+            reused = conn.sock is not None
+            try:
+                if not reused and CERT_PINS.get(conn.host):
+                    # У привязанного хоста нечего сверять по http — такой запрос не отправляем вовсе
+                    if not isinstance(conn, http.client.HTTPSConnection):
+                        raise ssl.SSLError(f"{conn.host} has pinned certificates, refusing plain HTTP")
+                    # Сертификат сверяем до отправки запроса
+                    conn.connect()
+                    self._check_pin(conn)
+                conn.request(method, path, body=data, headers=headers)
+                return conn.getresponse()
+            except (http.client.BadStatusLine, ConnectionError):
+                # Сервер закрыл простаивающее соединение — переподключаемся один раз
+                self.close()
+                if attempt or not reused:
+                    raise
+            except Exception:
+                self.close()
+                raise
+
+    def _release(self, response) -> None:
+        """Вернуть соединение для повторного использования или закрыть его"""
+        if not response.isclosed() and response.length == 0:
+            response.read()
+        # Недочитанное тело осталось бы в сокете и сломало следующий запрос
+        if not response.isclosed():
+            self.close()
+
+    def _make_request(self, endpoint: str, method: str = 'GET', headers: Dict = None, data: bytes = None) -> Tuple[int, bytes]:
+        # Ответ читается целиком, поэтому можно просить сжатие (games.json, update.json)
+        headers = {'Accept-Encoding': 'gzip', **headers} if headers else self._GZIP_HEADERS
+        
+        result = (500, b'')
+        with self._lock:
+            for attempt in range(REQUEST_RETRIES + 1):
+                if attempt:
+                    time.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+                try:
+                    response = self._connect(endpoint, method, headers, data)
+                    body = response.read()
+                    if response.getheader('Content-Encoding') == 'gzip':
+                        body = gzip.decompress(body)
+                except Exception as e:
+                    logging.error(f"Request error: {e}")
+                    self.close()
+                    continue
                 
-            conn.request(method, path, body=data, headers=headers or {})
-            response = conn.getresponse()
-            response_data = response.read()
-            return response.status, response_data
-        except Exception as e:
-            logging.error(f"Request error: {e}")
-            return 500, b''
-        finally:
-            conn.close()
+                result = (response.status, body)
+                if response.status not in RETRY_STATUSES:
+                    break
+                logging.warning(f"Server returned status {response.status}, retrying")
+        return result
+
+    @contextmanager
+    def _open_stream(self, endpoint: str, method: str = 'GET', headers: Dict = None, data: bytes = None):
+        """Открыть ответ без чтения тела — вызывающий читает его порциями"""
+        with self._lock:
+            response = self._connect(endpoint, method, headers, data)
+            try:
+                yield response
+            finally:
+                self._release(response)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self._conn_key = None
 
 class GameManager:
     def __init__(self, install_dir: str = "apps"):
         self.install_dir = Path(install_dir)
         self.install_dir.mkdir(exist_ok=True)
         self.cache_file = self.install_dir / "games_cache.json"
+        self._installed_cache = None
+        self._installed_key = None
+        # Кэш пишут и поток загрузки списка, и потоки установки
+        self._cache_lock = threading.RLock()
+        # Порог прогресса: на медленных каналах можно уменьшить, чтобы полоса двигалась чаще
+        self.progress_report_bytes = PROGRESS_REPORT_BYTES
         self._load_cache()
 
     def _load_cache(self) -> None:
+        self._cache_bytes = None
         if self.cache_file.exists():
-            with open(self.cache_file, 'r') as f:
-                self.cache = json.load(f)
+            data = self.cache_file.read_bytes()
+            self.cache = orjson.loads(data) if orjson else json.loads(data)
+            self._cache_bytes = data
         else:
             self.cache = {"games": {}, "last_update": 0}
 
     def _save_cache(self) -> None:
-        with open(self.cache_file, 'w') as f:
-            json.dump(self.cache, f)
+        with self._cache_lock:
+            data = orjson.dumps(self.cache) if orjson else json.dumps(self.cache).encode('utf-8')
+            if data == self._cache_bytes:
+                return  # На диске уже то же самое
+            # Пишем во временный файл и подменяем атомарно, чтобы сбой не испортил кэш
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.cache_file)
+            self._cache_bytes = data
 
     def update_cache(self, games_data: Dict) -> None:
-        self.cache["games"] = games_data
-        self.cache["last_update"] = time.time()
-        self._save_cache()
+        with self._cache_lock:
+            # Сервер чаще всего отдаёт тот же список — тогда файл не трогаем
+            if games_data == self.cache.get("games"):
+                return
+            self.cache["games"] = games_data
+            self.cache["last_update"] = time.time()
+            self._save_cache()
 
     def get_installed_games(self) -> Dict:
+        # Пересканируем каталог только если он изменился с прошлого раза
+        key = (self.install_dir, self.install_dir.stat().st_mtime_ns)
+        if self._installed_cache is not None and self._installed_key == key:
+            return self._installed_cache
+        
+        # DirEntry.is_dir() берёт тип из самого чтения каталога, без лишнего stat().
+        # Установленной считается только версия с отметкой: без неё там недокачка или сбой распаковки
         installed = {}
-        for game_dir in self.install_dir.iterdir():
-            if game_dir.is_dir():
-                versions = [v.name for v in game_dir.iterdir() if v.is_dir()]
-                if versions:
-                    installed[game_dir.name] = versions
+        with os.scandir(self.install_dir) as games:
+            for game_dir in games:
+                if game_dir.is_dir(follow_symlinks=False):
+                    with os.scandir(game_dir.path) as entries:
+                        versions = [v.name for v in entries if v.is_dir(follow_symlinks=False)
+                                    and os.path.isfile(os.path.join(v.path, INSTALL_MARKER))]
+                    if versions:
+                        installed[game_dir.name] = versions
+        
+        self._installed_cache = installed
+        self._installed_key = key
         return installed
 
-    def install_game(self, game_name: str, version: str, download_url: str, checksum: str, callback=None) -> bool:
+    def count_installed(self) -> int:
+        """Число установленных версий всех игр"""
+        return sum(len(versions) for versions in self.get_installed_games().values())
+
+    def _invalidate_installed(self) -> None:
+        # mtime корня не меняется при добавлении версии в уже существующую папку игры
+        self._installed_cache = None
+
+    def install_game(self, game_name: str, version: str, download_url: str, checksum: str, callback=None,
+                     checksum_algo: str = 'md5') -> bool:
+        if not checksum:
+            # Непроверенный архив не распаковываем (и отметке без суммы верить не на чем)
+            logging.error(f"No checksum for {game_name} {version}, refusing to install")
+            return False
+        
         game_path = self.install_dir / game_name / version
         game_path.mkdir(parents=True, exist_ok=True)
         
-        temp_file = game_path / f"{game_name}_{version}.tmp"
+        marker_file = game_path / INSTALL_MARKER
+        if self._read_marker(marker_file).get('checksum') == checksum:
+            logging.info(f"{game_name} {version} is already installed")
+            return True
+        
+        # Качаем сразу в итоговый файл: целостность гарантирует проверка контрольной суммы
         final_file = game_path / f"{game_name}_{version}.zip"
         
         try:
-            if self._download_file(download_url, temp_file, checksum, callback):
-                temp_file.rename(final_file)
+            if self._download_file(download_url, final_file, checksum, callback, checksum_algo):
                 if self._extract_archive(final_file, game_path):
                     final_file.unlink()
+                    marker_file.write_text(json.dumps({'checksum': checksum, 'installed_at': time.time()}))
+                    # Исполняемый файл ищем один раз, при установке, а не при каждом запуске
+                    exe_name = self._find_executable(game_path, game_name)
+                    if exe_name:
+                        self._set_executable(game_name, version, exe_name)
                     return True
+                # Архив проверен, но не распаковался (битый zip или небезопасные пути) — он не нужен
+                final_file.unlink()
         except Exception:
-            if temp_file.exists():
-                temp_file.unlink()
             if final_file.exists():
                 final_file.unlink()
+        finally:
+            # Пустая папка версии после неудачи выглядела бы как установленная игра
+            for path in (game_path, game_path.parent):
+                try:
+                    path.rmdir()
+                except OSError:
+                    break  # Не пустая — игра установлена, там остатки для докачки или другие версии
+            self._invalidate_installed()
         return False
 
+    def get_executable(self, game_name: str, version: str) -> Optional[Path]:
+        """exe установленной игры: из кэша, а если там нет или файл пропал — поиском в папке"""
+        game_path = self.install_dir / game_name / version
+        exe_name = self.cache.get('installed_exes', {}).get(f"{game_name}/{version}")
+        if exe_name and (game_path / exe_name).is_file():
+            return game_path / exe_name
+        
+        try:
+            exe_name = self._find_executable(game_path, game_name)
+        except OSError:
+            return None
+        if not exe_name:
+            return None
+        self._set_executable(game_name, version, exe_name)
+        return game_path / exe_name
+
+    def _find_executable(self, game_path: Path, game_name: str) -> Optional[str]:
+        """Имя исполняемого файла в корне игры; деинсталлятор не подходит, exe с именем игры — в приоритете"""
+        with os.scandir(game_path) as entries:
+            candidates = [entry.name for entry in entries
+                          if entry.name.lower().endswith('.exe') and not entry.name.lower().startswith('unins')
+                          and entry.is_file()]
+        preferred = [name for name in candidates if game_name.lower() in name.lower()]
+        return (preferred or candidates or [None])[0]
+
+    def _set_executable(self, game_name: str, version: str, exe_name: Optional[str]) -> None:
+        with self._cache_lock:
+            exes = self.cache.setdefault('installed_exes', {})
+            if exe_name:
+                exes[f"{game_name}/{version}"] = exe_name
+            else:
+                exes.pop(f"{game_name}/{version}", None)
+            self._save_cache()
+
+    def _read_marker(self, marker_file: Path) -> Dict:
+        """Прочитать отметку об успешной установке (пустой словарь, если её нет)"""
+        try:
+            return json.loads(marker_file.read_text())
+        except (OSError, ValueError):
+            return {}
+
     def uninstall_game(self, game_name: str, version: str) -> bool:
         """Удалить игру с устройства"""
         try:
             game_path = self.install_dir / game_name / version
             if game_path.exists():
                 shutil.rmtree(game_path)
+                self._invalidate_installed()
+                self._set_executable(game_name, version, None)
                 logging.info(f"Successfully uninstalled {game_name} {version}")
                 
                 # Удаляем родительскую папку если она пустая
@@ -119,86 +554,435 @@ class GameManager:
             return False
         except Exception as e:
             logging.error(f"Uninstall error: {e}")
+            self._invalidate_installed()
             return False
 
-    def _download_file(self, url: str, dest: Path, expected_checksum: str, callback=None) -> bool:
-        print(f"Starting download: {url} -> {dest}")
+    def _download_file(self, url: str, dest: Path, expected_checksum: Optional[str], callback=None,
+                       checksum_algo: str = 'md5', verify_ssl: bool = True,
+                       digests: Optional[Dict[str, Optional[bytes]]] = None) -> bool:
+        """Скачать файл с докачкой и проверкой контрольной суммы.
+
+        digests — необязательный словарь с именами алгоритмов в ключах: после успешной загрузки
+        в нём дайджесты файла по этим алгоритмам, посчитанные тем же проходом, что и checksum.
+        """
+        logging.debug("Starting download: %s -> %s", url, dest)
+        extra_algos = tuple(digests or ())
+        if not _algorithms_available(checksum_algo, *extra_algos):
+            return False
         
-        handler = SecureRequestHandler(url)
+        handler = SecureRequestHandler(url, verify_ssl=verify_ssl)
         
-        headers = {}
-        if dest.exists():
-            file_size = dest.stat().st_size
-            headers['Range'] = f'bytes={file_size}-'
-            print(f"Resuming download from byte {file_size}")
+        state = self._load_resume_state(dest)
+        if state is None and not dest.exists():
+            size = self._probe_size(handler)
+            segments = min(MAX_SEGMENTS, -(-size // SEGMENT_MIN_SIZE))
+            if segments > 1:
+                step = -(-size // segments)
+                ranges = [[start, min(start + step, size) - 1, 0] for start in range(0, size, step)]
+                state = {'size': size, 'ranges': ranges}
+        
+        if state is not None:
+            handler.close()
+            return self._download_segmented(url, dest, state['size'], state['ranges'], expected_checksum,
+                                            callback, checksum_algo, verify_ssl, digests)
+        
+        # Хешер живёт между попытками: после обрыва связи хешируются только новые байты
+        hasher = _MultiHasher(checksum_algo, extra_algos)
+        done = 0
+        buf = bytearray(DOWNLOAD_CHUNK_SIZE)
+        view = memoryview(buf)
         
         try:
-            status, response = handler._make_request('', headers=headers)
-            print(f"Download status: {status}")
-            print(f"Response length: {len(response)}")
-            
-            if status == 206:  # Partial Content
-                mode = 'ab'
-                print("Resuming partial download")
-            elif status == 200:  # Full Content
-                mode = 'wb'
-                print("Starting new download")
-            else:
-                print(f"Download failed with status: {status}")
-                return False
-            
-            with open(dest, mode) as f:
-                f.write(response)
+            for attempt in range(DOWNLOAD_ATTEMPTS):
+                file_size = dest.stat().st_size if dest.exists() else 0
+                headers = {'Range': f'bytes={file_size}-'} if file_size else {}
+                
+                try:
+                    with handler._open_stream('', headers=headers) as response:
+                        status = response.status
+                        logging.debug("Download status: %d", status)
+                        
+                        if status in (206, 416) and file_size:  # Partial Content / уже всё скачано
+                            if done != file_size:
+                                # Часть, скачанную до перезапуска, прогоняем через хешер один раз
+                                hasher = _MultiHasher(checksum_algo, extra_algos)
+                                _hash_file(dest, hasher)
+                                done = file_size
+                            if status == 416:
+                                break
+                            mode = 'ab'
+                            logging.debug("Resuming download from byte %d", file_size)
+                        elif status == 200:  # Full Content
+                            mode = 'wb'
+                            hasher = _MultiHasher(checksum_algo, extra_algos)
+                            done = file_size = 0
+                            logging.debug("Starting new download")
+                        else:
+                            logging.error("Download failed with status: %d", status)
+                            return False
+                        
+                        length = response.getheader('Content-Length')
+                        total = file_size + int(length) if length else 0
+                        progress = _ProgressReporter(callback, total, self.progress_report_bytes)
+                        
+                        # Пишем тело порциями через один переиспользуемый буфер, не держа весь архив в памяти
+                        with open(dest, mode) as f:
+                            while True:
+                                n = response.readinto(buf)
+                                if not n:
+                                    break
+                                chunk = view[:n]
+                                f.write(chunk)
+                                hasher.update(chunk)
+                                done += n
+                                progress.report(done)
+                        
+                        if done < total:
+                            raise http.client.IncompleteRead(b'', total - done)
+                    break
+                except (OSError, http.client.HTTPException) as e:
+                    if attempt == DOWNLOAD_ATTEMPTS - 1:
+                        raise
+                    logging.warning("Download interrupted (%s), resuming from byte %d", e, done)
             
-            print(f"File downloaded, size: {dest.stat().st_size} bytes")
+            logging.debug("File downloaded, size: %d bytes", done)
             
-            # Проверяем контрольную сумму
-            if self._verify_checksum(dest, expected_checksum):
-                print("Checksum verified successfully")
+            # Контрольная сумма посчитана по ходу загрузки (None — проверка не требуется)
+            if expected_checksum is None or digest_matches(hasher, expected_checksum):
+                logging.debug("Checksum verified successfully")
+                if digests is not None:
+                    digests.update(hasher.digests())
                 return True
             else:
-                print("Checksum verification failed")
+                # Испорченный файл полного размера докачивать нечем: 416 и та же ошибка при каждой попытке
+                logging.error("Checksum verification failed for %s", dest)
+                dest.unlink()
                 return False
                 
         except Exception as e:
-            print(f"Download error: {e}")
+            logging.error("Download error: %s", e)
             return False
+        finally:
+            handler.close()
+
+    def _probe_size(self, handler: SecureRequestHandler) -> int:
+        """Размер файла на сервере, если он отдаёт его по частям (иначе 0)"""
+        try:
+            with handler._open_stream('', method='HEAD') as response:
+                if response.status != 200 or response.getheader('Accept-Ranges') != 'bytes':
+                    return 0
+                return int(response.getheader('Content-Length') or 0)
+        except Exception as e:
+            logging.debug("Size probe failed: %s", e)
+            return 0
 
-    def _verify_checksum(self, file_path: Path, expected: str) -> bool:
-        hash_md5 = hashlib.md5()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest() == expected
+    def _resume_state_file(self, dest: Path) -> Path:
+        return dest.with_name(dest.name + '.resume.json')
+
+    def _load_resume_state(self, dest: Path) -> Optional[Dict]:
+        """Состояние прерванной сегментной загрузки (None, если продолжать нечего)"""
+        state_file = self._resume_state_file(dest)
+        if not state_file.exists():
+            return None
+        try:
+            state = json.loads(state_file.read_text())
+            if dest.exists() and dest.stat().st_size == state['size'] \
+                    and all(len(segment) == 3 for segment in state['ranges']):
+                return state
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        # Предвыделенный файл без годного состояния — данные вперемешку с нулями; как обычную
+        # докачку его не продолжить (416 и хеш нулей), поэтому начинаем с чистого места
+        state_file.unlink()
+        if dest.exists():
+            dest.unlink()
+        return None
+
+    def _download_segmented(self, url: str, dest: Path, size: int, ranges: List[List[int]],
+                            expected_checksum: Optional[str], callback=None, checksum_algo: str = 'md5',
+                            verify_ssl: bool = True, digests: Optional[Dict[str, Optional[bytes]]] = None) -> bool:
+        """Скачать файл параллельными Range-запросами; ranges — [start, end, done] на сегмент"""
+        logging.debug("Downloading %d bytes in %d segments", size, len(ranges))
+        
+        state_file = self._resume_state_file(dest)
+        state_lock = threading.Lock()
+        restart = []
+        progress = _ProgressReporter(callback, size, self.progress_report_bytes)
+        
+        def save_state() -> None:
+            # Прогресс сегментов на диске, чтобы после перезапуска докачать только недостающее.
+            # Через временный файл и os.replace: оборванная запись не оставит испорченное состояние
+            with state_lock:
+                tmp_file = state_file.with_name(state_file.name + '.tmp')
+                tmp_file.write_text(json.dumps({'size': size, 'ranges': ranges}))
+                os.replace(tmp_file, state_file)
+        
+        # Состояние пишем раньше, чем выделяем файл: без него предвыделенный файл не останется
+        save_state()
+        if not dest.exists():
+            with open(dest, 'wb') as f:
+                _preallocate(f, size)
+        
+        def fetch(segment: List[int]) -> None:
+            start, end = segment[0], segment[1]
+            if start + segment[2] > end:
+                return
+            
+            handler = SecureRequestHandler(url, verify_ssl=verify_ssl)
+            try:
+                # Оборванный сегмент докачивается с места обрыва, как и загрузка одним потоком
+                for attempt in range(DOWNLOAD_ATTEMPTS):
+                    if attempt:
+                        time.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+                    offset = start + segment[2]
+                    try:
+                        with handler._open_stream('', headers={'Range': f'bytes={offset}-{end}'}) as response:
+                            status = response.status
+                            if status != 206:
+                                # Сервер перестал отдавать части — повтор не поможет
+                                restart.append(segment)
+                                break
+                            # Каждый поток пишет через свой дескриптор в свою область файла.
+                            # Без буферизации: сохранённый прогресс не опережает данные в файле
+                            with open(dest, 'r+b', buffering=0) as f:
+                                f.seek(offset)
+                                unsaved = 0
+                                buf = bytearray(DOWNLOAD_CHUNK_SIZE)
+                                view = memoryview(buf)
+                                while True:
+                                    n = response.readinto(buf)
+                                    if not n:
+                                        break
+                                    f.write(view[:n])
+                                    segment[2] += n
+                                    progress.report(sum(r[2] for r in ranges))
+                                    unsaved += n
+                                    if unsaved >= RESUME_SAVE_INTERVAL:
+                                        save_state()
+                                        unsaved = 0
+                        if start + segment[2] > end:
+                            return
+                        raise IOError(f"segment {start}-{end} is incomplete")
+                    except (OSError, http.client.HTTPException) as e:
+                        if attempt == DOWNLOAD_ATTEMPTS - 1:
+                            raise
+                        logging.warning("Segment %d-%d interrupted (%s), resuming from byte %d",
+                                        start, end, e, start + segment[2])
+                raise IOError(f"segment {start}-{end} returned status {status}")
+            finally:
+                handler.close()
+        
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [pool.submit(fetch, segment) for segment in ranges]
+        errors = [future.exception() for future in futures if future.exception()]
+        
+        if errors:
+            logging.error("Download error: %s", errors[0])
+            if restart:
+                # Сервер перестал отдавать части — начинать придётся с нуля
+                state_file.unlink()
+                dest.unlink()
+            else:
+                save_state()
+            return False
+        
+        state_file.unlink()
+        hasher = _MultiHasher(checksum_algo, tuple(digests or ()))
+        if expected_checksum is not None or digests:
+            # Сегменты шли вразнобой — файл читаем один раз сразу для всех нужных хешей
+            _hash_file(dest, hasher)
+        if expected_checksum is None or digest_matches(hasher, expected_checksum):
+            logging.debug("Checksum verified successfully")
+            if digests is not None:
+                digests.update(hasher.digests())
+            return True
+        
+        logging.error("Checksum verification failed for %s", dest)
+        dest.unlink()
+        return False
+
+    def _download_chunked(self, url: str, dest: Path, chunk_size: int, chunk_checksums: List[str],
+                          expected_checksum: Optional[str], checksum_algo: str = 'md5',
+                          chunk_checksum_algo: str = 'sha256', callback=None, verify_ssl: bool = True,
+                          digests: Optional[Dict[str, Optional[bytes]]] = None) -> bool:
+        """Скачать файл кусками chunk_size параллельно, сверяя каждый кусок с его контрольной суммой.
+
+        Испорченный или оборванный кусок перекачивается отдельно; если кусок так и не скачался,
+        остальные уже не запрашиваются. Если сервер не отдаёт файл по частям или список сумм
+        не сходится с размером — обычная загрузка целиком.
+        Для expected_checksum и digests собранный файл один раз читается с диска целиком.
+        """
+        if not _algorithms_available(checksum_algo, chunk_checksum_algo, *(digests or ())):
+            return False
+        # Список из update.json проверяем до загрузки: кривая запись — провал, а не исключение в потоке
+        if not isinstance(chunk_checksums, list) or not all(
+                isinstance(checksum, str) and checksum for checksum in chunk_checksums):
+            logging.error("Malformed chunk_checksums for %s", url)
+            return False
+        
+        probe = SecureRequestHandler(url, verify_ssl=verify_ssl)
+        try:
+            size = self._probe_size(probe)
+        finally:
+            probe.close()
+        
+        count = len(chunk_checksums)
+        if chunk_size <= 0 or not size or -(-size // chunk_size) != count:
+            logging.warning("Chunk checksums are not usable for %s, downloading as a whole", url)
+            return self._download_file(url, dest, expected_checksum, callback, checksum_algo, verify_ssl,
+                                       digests)
+        
+        logging.debug("Downloading %d bytes in %d verified chunks", size, count)
+        with open(dest, 'wb') as f:
+            _preallocate(f, size)
+        
+        # Поток держит своё keep-alive соединение на все свои куски
+        local = threading.local()
+        handlers = []
+        received = [0] * count
+        progress = _ProgressReporter(callback, size, self.progress_report_bytes)
+        failed = threading.Event()
+        
+        def fetch(index: int) -> None:
+            start = index * chunk_size
+            end = min(start + chunk_size, size) - 1
+            handler = getattr(local, 'handler', None)
+            if handler is None:
+                handler = local.handler = SecureRequestHandler(url, verify_ssl=verify_ssl)
+                handlers.append(handler)
+            buf = bytearray(min(chunk_size, DOWNLOAD_CHUNK_SIZE))
+            view = memoryview(buf)
+            
+            for attempt in range(DOWNLOAD_ATTEMPTS):
+                # Другой кусок уже не скачался — загрузка всё равно провалена
+                if failed.is_set():
+                    raise IOError(f"chunk {index} skipped after an earlier failure")
+                hasher = _new_hasher(chunk_checksum_algo)
+                received[index] = 0
+                try:
+                    with handler._open_stream('', headers={'Range': f'bytes={start}-{end}'}) as response:
+                        if response.status != 206:
+                            raise IOError(f"chunk {index} returned status {response.status}")
+                        with open(dest, 'r+b', buffering=0) as f:
+                            f.seek(start)
+                            while True:
+                                n = response.readinto(buf)
+                                if not n:
+                                    break
+                                chunk = view[:n]
+                                f.write(chunk)
+                                hasher.update(chunk)
+                                received[index] += n
+                                progress.report(sum(received))
+                    if received[index] == end - start + 1 and digest_matches(hasher, chunk_checksums[index]):
+                        return
+                    logging.warning("Chunk %d failed verification, retrying", index)
+                except (OSError, http.client.HTTPException) as e:
+                    logging.warning("Chunk %d interrupted (%s), retrying", index, e)
+            received[index] = 0
+            failed.set()
+            raise IOError(f"chunk {index} could not be downloaded")
+        
+        try:
+            with ThreadPoolExecutor(max_workers=UPDATE_DOWNLOAD_WORKERS) as pool:
+                list(pool.map(fetch, range(count)))
+        except Exception as e:
+            logging.error("Download error: %s", e)
+            dest.unlink()
+            return False
+        finally:
+            for handler in handlers:
+                handler.close()
+        
+        logging.debug("All %d chunks verified", count)
+        hasher = _MultiHasher(checksum_algo, tuple(digests or ()))
+        if expected_checksum is not None or digests:
+            # Куски приходили вразнобой — как и для сегментов, файл читаем один раз для всех хешей
+            _hash_file(dest, hasher)
+        if expected_checksum is not None and not digest_matches(hasher, expected_checksum):
+            logging.error("Checksum verification failed for %s", dest)
+            dest.unlink()
+            return False
+        if digests is not None:
+            digests.update(hasher.digests())
+        return True
 
     def _extract_archive(self, archive_path: Path, extract_to: Path) -> bool:
+        root = extract_to.resolve()
         try:
+            members = []
+            dirs = set()
             with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_to)
+                for info in zip_ref.infolist():
+                    target = (root / info.filename).resolve()
+                    if target != root and root not in target.parents:
+                        raise zipfile.BadZipFile(f"Unsafe path in archive: {info.filename}")
+                    
+                    if info.is_dir():
+                        dirs.add(target)
+                    else:
+                        dirs.add(target.parent)
+                        members.append((info, target))
+            
+            # Все каталоги создаём заранее одним проходом — потокам остаётся только запись файлов
+            for directory in sorted(dirs):
+                directory.mkdir(parents=True, exist_ok=True)
+            
+            # ZipFile не потокобезопасен между open(), поэтому у каждого потока свой дескриптор
+            local = threading.local()
+            handles = []
+            
+            def extract(member) -> None:
+                info, target = member
+                zip_ref = getattr(local, 'zip_ref', None)
+                if zip_ref is None:
+                    fp = open(archive_path, 'rb', buffering=EXTRACT_BUFFER_SIZE)
+                    _advise_sequential(fp)
+                    zip_ref = local.zip_ref = zipfile.ZipFile(fp)
+                    handles.append((zip_ref, fp))
+                with zip_ref.open(info) as src, open(target, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, EXTRACT_BUFFER_SIZE)
+            
+            workers = max(1, min(os.cpu_count() or 1, len(members)))
+            try:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    for _ in pool.map(extract, members):
+                        pass
+            finally:
+                for zip_ref, fp in handles:
+                    zip_ref.close()
+                    fp.close()
             return True
         except zipfile.BadZipFile:
             return False
 
 class DownloadWorker(threading.Thread):
-    def __init__(self, game_manager: GameManager, game_data: Dict, install_dir: str, progress_callback=None, completion_callback=None):
+    def __init__(self, game_manager: GameManager, game_data: Dict, download_url: str, install_dir: str,
+                 progress_callback=None, completion_callback=None):
         super().__init__()
         self.game_manager = game_manager
         self.game_data = game_data
+        self.download_url = download_url
         self.install_dir = install_dir
         self.progress_callback = progress_callback
         self.completion_callback = completion_callback
         self._stop_event = threading.Event()
 
     def run(self) -> None:
-        # Используем полный URL для скачивания
-        download_url = self.game_data.get('download_url', self.game_data['download_path'])
-        success = self.game_manager.install_game(
-            self.game_data['name'],
-            self.game_data['version'],
-            download_url,  # Передаем полный URL
-            self.game_data['checksum'],
-            self.progress_callback
-        )
+        try:
+            checksum, checksum_algo = pick_checksum(self.game_data)
+        except ValueError as e:
+            logging.error(f"Cannot verify {self.game_data['name']}: {e}")
+            success = False
+        else:
+            success = self.game_manager.install_game(
+                self.game_data['name'],
+                self.game_data['version'],
+                self.download_url,  # Передаем полный URL
+                checksum,
+                self.progress_callback,
+                checksum_algo
+            )
         if self.completion_callback:
             self.completion_callback(success, self.game_data)
 
@@ -272,43 +1056,67 @@ class GameCard(ttk.Frame):
         header_frame = ttk.Frame(main_frame, style='GameCard.TFrame')
         header_frame.pack(fill='x', pady=(0, 5))
         
-        ttk.Label(header_frame, text=self.game_data['name'], 
-                 font=('Segoe UI', 12, 'bold'), style='TLabel').pack(side='left')
+        self.name_label = ttk.Label(header_frame, font=('Segoe UI', 12, 'bold'), style='TLabel')
+        self.name_label.pack(side='left')
         
-        version_label = ttk.Label(header_frame, text=f"v{self.game_data['version']}", 
-                                 font=('Segoe UI', 9), foreground='#cccccc')
-        version_label.pack(side='right')
+        self.version_label = ttk.Label(header_frame, font=('Segoe UI', 9), foreground='#cccccc')
+        self.version_label.pack(side='right')
         
         # Описание
         desc_frame = ttk.Frame(main_frame, style='GameCard.TFrame')
         desc_frame.pack(fill='x', pady=5)
-        ttk.Label(desc_frame, text=self.game_data['description'], 
-                 wraplength=600, style='TLabel').pack(anchor='w')
+        self.desc_label = ttk.Label(desc_frame, wraplength=600, style='TLabel')
+        self.desc_label.pack(anchor='w')
         
         # Информация о системе
         info_frame = ttk.Frame(main_frame, style='GameCard.TFrame')
         info_frame.pack(fill='x', pady=8)
         
-        ttk.Label(info_frame, text=f"📦 {self.game_data['file_size']} MB", 
-                 font=('Segoe UI', 9)).pack(side='left', padx=(0, 20))
-        ttk.Label(info_frame, text=f"💾 {self.game_data['required_ram']} GB RAM", 
-                 font=('Segoe UI', 9)).pack(side='left', padx=(0, 20))
-        ttk.Label(info_frame, text=f"💿 {self.game_data['required_storage']} GB Storage", 
-                 font=('Segoe UI', 9)).pack(side='left')
+        self.size_label = ttk.Label(info_frame, font=('Segoe UI', 9))
+        self.size_label.pack(side='left', padx=(0, 20))
+        self.ram_label = ttk.Label(info_frame, font=('Segoe UI', 9))
+        self.ram_label.pack(side='left', padx=(0, 20))
+        self.storage_label = ttk.Label(info_frame, font=('Segoe UI', 9))
+        self.storage_label.pack(side='left')
         
         # Кнопки действий
-        button_frame = ttk.Frame(main_frame, style='GameCard.TFrame')
-        button_frame.pack(fill='x', pady=(10, 0))
+        self.button_frame = ttk.Frame(main_frame, style='GameCard.TFrame')
+        self.button_frame.pack(fill='x', pady=(10, 0))
+        
+        self._fill_labels()
+        self._build_buttons()
+
+    def update_game(self, game_data, installed=False):
+        """Перенастроить карточку под другую игру, не пересоздавая виджеты"""
+        if game_data is not self.game_data:
+            self.game_data = game_data
+            self._fill_labels()
+        # Команды кнопок читают self.game_data, поэтому пересобираем их только при смене состояния
+        if installed != self.installed:
+            self.installed = installed
+            self._build_buttons()
+
+    def _fill_labels(self):
+        self.name_label.config(text=self.game_data['name'])
+        self.version_label.config(text=f"v{self.game_data['version']}")
+        self.desc_label.config(text=self.game_data['description'])
+        self.size_label.config(text=f"📦 {self.game_data['file_size']} MB")
+        self.ram_label.config(text=f"💾 {self.game_data['required_ram']} GB RAM")
+        self.storage_label.config(text=f"💿 {self.game_data['required_storage']} GB Storage")
+
+    def _build_buttons(self):
+        for widget in self.button_frame.winfo_children():
+            widget.destroy()
         
         if self.installed:
-            ttk.Button(button_frame, text="🎮 Launch", 
+            ttk.Button(self.button_frame, text="🎮 Launch", 
                       command=lambda: self.on_launch(self.game_data),
                       style='Success.TButton').pack(side='left', padx=(0, 10))
-            ttk.Button(button_frame, text="🗑️ Uninstall", 
+            ttk.Button(self.button_frame, text="🗑️ Uninstall", 
                       command=lambda: self.on_uninstall(self.game_data),
                       style='Danger.TButton').pack(side='left')
         else:
-            ttk.Button(button_frame, text="⬇️ Install", 
+            ttk.Button(self.button_frame, text="⬇️ Install", 
                       command=lambda: self.on_install(self.game_data),
                       style='Accent.TButton').pack(side='left')
 
@@ -321,37 +1129,76 @@ class PintuxxGameLauncher:
         
         # Версия лаунчера
         self.launcher_version = "1.1.0"
-        self.update_url = "http://biggod.pythonanywhere.com/launcher/update.json"
+        self._launcher_version_tuple = self._parse_version(self.launcher_version)
+        self.update_url = "https://biggod.pythonanywhere.com/launcher/update.json"
         
         ModernTheme.apply(self.root)
         
         self.game_manager = GameManager()
-        self.server_handler = SecureRequestHandler("https://biggod.pythonanywhere.com")
+        # Один обработчик на всё время работы: keep-alive соединение переживает обновления списка
+        self.server_handler = SecureRequestHandler("http://biggod.pythonanywhere.com", verify_ssl=False)
+        # Отдельный долгоживущий обработчик для update.json: проверка при старте не ждёт загрузку списка игр
+        self.update_handler = SecureRequestHandler(self.update_url)
         self.download_queue = []
         self.active_downloads = {}
+        self._pending_progress: Dict[str, int] = {}
+        self._search_after = None
+        # Запуск игр и удаление файлов — в фоне, чтобы окно не замирало
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._busy_count = 0
+        # Игры, которые сейчас удаляются в фоне: кнопки их карточек до конца удаления игнорируются
+        self._uninstalling = set()
+        self._update_thread = None
+        # Обновление качается рядом с лаунчером: замена exe тогда — переименование на том же томе
+        self._update_dir = Path(sys.argv[0]).absolute().parent / "temp_update"
+        self._search_term = ''
+        
+        # Виртуальный список: карточки создаются только под видимые строки и переиспользуются при прокрутке
+        self._games: List[Dict] = []
+        self._search_texts: List[str] = []
+        self._shown_games: List[Dict] = []
+        self._card_pool: List[GameCard] = []
+        self._row_height = 0
+        self._render_pending = False
         
         self.setup_logging()
         self.setup_ui()
+        self.root.after(PROGRESS_FLUSH_MS, self._flush_progress)
         self.load_games()
+        self._purge_stale_update()
         self._auto_check_updates()
     
+    def _purge_stale_update(self):
+        """Удалить остатки прерванных обновлений старше суток из temp_update"""
+        temp_dir = self._update_dir
+        if not temp_dir.is_dir():
+            return
+        cutoff = time.time() - 86400
+        with os.scandir(temp_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except OSError:
+                    pass  # Файл занят — попробуем при следующем запуске
+        try:
+            temp_dir.rmdir()  # Только если папка опустела
+        except OSError:
+            pass
+
     def _auto_check_updates(self):
         """Автоматически проверять обновления раз в день"""
         last_check_file = Path("last_update_check.txt")
         
+        # Время последней проверки — это mtime файла, содержимое не читаем
         try:
-            if last_check_file.exists():
-                with open(last_check_file, 'r') as f:
-                    last_check = float(f.read().strip())
-                # Проверяем раз в день
-                if time.time() - last_check < 86400:  # 24 часа
-                    return
-        except:
+            if time.time() - last_check_file.stat().st_mtime < 86400:  # 24 часа
+                return
+        except FileNotFoundError:
             pass
         
         # Сохраняем время проверки
-        with open(last_check_file, 'w') as f:
-            f.write(str(time.time()))
+        last_check_file.touch()
         
         # Запускаем проверку в фоне
         threading.Thread(target=self._background_update_check, daemon=True).start()
@@ -359,14 +1206,13 @@ class PintuxxGameLauncher:
     def _background_update_check(self):
         """Фоновая проверка обновлений"""
         try:
-            handler = SecureRequestHandler(self.update_url, verify_ssl=False)
-            status, response = handler._make_request('')
+            status, response = self.update_handler._make_request('')
             
             if status == 200:
                 update_info = json.loads(response.decode('utf-8'))
                 latest_version = update_info.get('version')
                 
-                if self._compare_versions(self.launcher_version, latest_version) < 0:
+                if self._compare_versions(latest_version) < 0:
                     # Показываем уведомление в основном потоке
                     self.root.after(0, lambda: self._show_update_notification(update_info))
         except:
@@ -384,7 +1230,9 @@ class PintuxxGameLauncher:
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s',
             handlers=[
-                logging.FileHandler('launcher.log'),
+                # Лог не растёт бесконечно: 1 МБ на файл и три старых копии
+                logging.handlers.RotatingFileHandler('launcher.log', maxBytes=1 << 20, backupCount=3,
+                                                     encoding='utf-8'),
                 logging.StreamHandler()
             ]
         )
@@ -433,7 +1281,14 @@ class PintuxxGameLauncher:
         stats_frame.pack(fill='x', pady=(0, 15))
         
         self.stats_label = ttk.Label(stats_frame, text="Loading...", font=('Segoe UI', 10))
-        self.stats_label.pack(anchor='w')
+        self.stats_label.pack(side='left')
+        
+        # Индикатор долгих фоновых операций (удаление игры); показывается только на время работы
+        self.busy_frame = ttk.Frame(stats_frame)
+        self.busy_label = ttk.Label(self.busy_frame, font=('Segoe UI', 10))
+        self.busy_label.pack(side='left', padx=(0, 10))
+        self.busy_bar = ttk.Progressbar(self.busy_frame, mode='indeterminate', length=150)
+        self.busy_bar.pack(side='left')
         
         self.setup_games_frame(main_frame)
         self.setup_downloads_frame(main_frame)
@@ -462,15 +1317,14 @@ class PintuxxGameLauncher:
         canvas_frame.pack(fill='both', expand=True)
         
         self.canvas = tk.Canvas(canvas_frame, bg='#1a1a1a', highlightthickness=0)
-        scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=self.canvas.yview)
-        self.scrollable_frame = ttk.Frame(self.canvas)
+        self.games_scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=self.canvas.yview)
         
-        self.scrollable_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        # Карточки — окна прямо на холсте; при любом сдвиге вида перерисовываем видимые строки
+        self.canvas.configure(yscrollcommand=self._on_canvas_yview)
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
         
         self.canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        self.games_scrollbar.pack(side="right", fill="y")
         
         # Привязываем прокрутку колесиком мыши
         self.canvas.bind("<MouseWheel>", self._on_mousewheel)
@@ -478,6 +1332,94 @@ class PintuxxGameLauncher:
     def _on_mousewheel(self, event):
         self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
 
+    def _on_canvas_yview(self, first, last):
+        self.games_scrollbar.set(first, last)
+        self._schedule_render()
+
+    def _on_canvas_configure(self, event):
+        for card in self._card_pool:
+            self.canvas.itemconfigure(card.window_id, width=event.width)
+        self._update_scrollregion()
+        self._schedule_render()
+
+    def _update_scrollregion(self):
+        height = len(self._shown_games) * self._row_height
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), height))
+
+    def _schedule_render(self):
+        # Несколько событий прокрутки подряд дают одну перерисовку
+        if not self._render_pending:
+            self._render_pending = True
+            self.root.after_idle(self._render_cards)
+
+    def _new_card(self, game_data: Dict, installed: bool) -> GameCard:
+        card = GameCard(
+            self.canvas,
+            game_data,
+            self.queue_download,
+            self.launch_game,
+            self.uninstall_game,  # Новая функция удаления
+            installed
+        )
+        card.window_id = self.canvas.create_window(0, 0, window=card, anchor='nw', state='hidden',
+                                                   width=self.canvas.winfo_width())
+        if self._row_height:
+            self.canvas.itemconfigure(card.window_id, height=self._row_height - CARD_SPACING)
+        self._card_pool.append(card)
+        return card
+
+    def _render_cards(self):
+        """Показать карточки только для строк в видимой области (плюс запас сверху и снизу)"""
+        self._render_pending = False
+        games = self._shown_games
+        installed_games = self.game_manager.get_installed_games()
+        
+        def is_installed(game_info: Dict) -> bool:
+            return game_info['version'] in installed_games.get(game_info['name'], ())
+        
+        if games and not self._row_height:
+            # Строки одной высоты, поэтому меряем по самому длинному описанию (по символам и по
+            # строкам), чтобы перенос по wraplength ни у одной карточки не обрезался
+            tallest = {id(game_info): game_info for game_info in (
+                max(self._games, key=lambda g: len(g['description'])),
+                max(self._games, key=lambda g: g['description'].count('\n')))}
+            height = 0
+            for game_info in tallest.values():
+                if self._card_pool:
+                    card = self._card_pool[0]
+                    card.update_game(game_info, is_installed(game_info))
+                else:
+                    card = self._new_card(game_info, is_installed(game_info))
+                card.update_idletasks()
+                height = max(height, card.winfo_reqheight())
+            self._row_height = height + CARD_SPACING
+            for card in self._card_pool:
+                self.canvas.itemconfigure(card.window_id, height=height)
+            self._update_scrollregion()
+        
+        rows = range(0)
+        if games:
+            first = max(0, int(self.canvas.canvasy(0)) // self._row_height - CARD_OVERSCAN)
+            count = self.canvas.winfo_height() // self._row_height + 2 * CARD_OVERSCAN + 1
+            rows = range(first, min(len(games), first + count))
+        
+        while len(self._card_pool) < len(rows):
+            game_info = games[rows[len(self._card_pool)]]
+            self._new_card(game_info, is_installed(game_info))
+        
+        # Строка всегда достаётся карточке с тем же остатком от деления, поэтому при сдвиге
+        # на одну строку перенастраивается одна карточка, а не все
+        shown = set()
+        for index in rows:
+            card = self._card_pool[index % len(self._card_pool)]
+            card.update_game(games[index], is_installed(games[index]))
+            self.canvas.coords(card.window_id, 0, index * self._row_height + CARD_SPACING // 2)
+            self.canvas.itemconfigure(card.window_id, state='normal')
+            shown.add(card)
+        for card in self._card_pool:
+            if card not in shown:
+                self.canvas.itemconfigure(card.window_id, state='hidden')
+
     def setup_downloads_frame(self, parent):
         downloads_frame = ttk.LabelFrame(parent, text="📥 Active Downloads", padding=10)
         downloads_frame.pack(fill='x', pady=10)
@@ -498,80 +1440,83 @@ class PintuxxGameLauncher:
         self.downloads_tree.pack(fill='x')
 
     def on_search(self, event=None):
-        """Фильтрация игр по поиску"""
+        """Фильтрация игр по поиску (с задержкой, пока пользователь печатает)"""
+        if self._search_after is not None:
+            self.root.after_cancel(self._search_after)
+        self._search_after = self.root.after(SEARCH_DEBOUNCE_MS, self._apply_search)
+
+    def _apply_search(self):
+        self._search_after = None
         search_term = self.search_var.get().lower()
-        for widget in self.scrollable_frame.winfo_children():
-            if hasattr(widget, 'game_data'):
-                game_name = widget.game_data['name'].lower()
-                game_desc = widget.game_data['description'].lower()
-                if search_term in game_name or search_term in game_desc:
-                    widget.pack(fill='x', pady=5)
-                else:
-                    widget.pack_forget()
+        # Строки поиска готовятся в display_games, а не на каждое нажатие клавиши
+        if search_term:
+            self._shown_games = [game_info for game_info, text in zip(self._games, self._search_texts)
+                                 if search_term in text]
+        else:
+            self._shown_games = self._games
+        if search_term != self._search_term:
+            self._search_term = search_term
+            self.canvas.yview_moveto(0)
+        self._update_scrollregion()
+        self._schedule_render()
 
     def clear_search(self):
         """Очистить поиск"""
         self.search_var.set("")
-        self.on_search()
+        self._apply_search()
 
     def load_games(self):
+        # Сразу показываем кэш, а свежий список с сервера подтягиваем в фоне
+        self.display_games(self.game_manager.cache.get("games", {}))
+        self.update_stats()
+        threading.Thread(target=self._fetch_games_worker, daemon=True).start()
+
+    def _fetch_games_worker(self):
+        """Загрузить список игр с сервера (в фоновом потоке)"""
         try:
-            self.server_handler = SecureRequestHandler("http://biggod.pythonanywhere.com", verify_ssl=False)
             status, response = self.server_handler._make_request('/games.json')
             if status == 200:
                 games_data = json.loads(response.decode('utf-8'))
                 self.game_manager.update_cache(games_data)
-                self.display_games(games_data)
-                self.update_stats()
+                # Виджеты трогаем только из основного потока
+                self.root.after(0, self._on_games_loaded, games_data)
                 logging.info("Successfully loaded games from server")
             else:
                 logging.warning(f"Server returned status {status}, using cache")
-                self.display_games(self.game_manager.cache.get("games", {}))
-                self.update_stats()
         except Exception as e:
             logging.error(f"Error loading games: {e}")
-            self.display_games(self.game_manager.cache.get("games", {}))
-            self.update_stats()
+
+    def _on_games_loaded(self, games_data: Dict):
+        self.display_games(games_data)
+        self.update_stats()
 
     def update_stats(self):
         """Обновить статистику"""
-        installed_games = self.game_manager.get_installed_games()
-        total_installed = sum(len(versions) for versions in installed_games.values())
+        total_installed = self.game_manager.count_installed()
         self.stats_label.config(text=f"📊 Total installed: {total_installed} games")
 
     def display_games(self, games_data: Dict):
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        
-        installed_games = self.game_manager.get_installed_games()
-        
-        for game_id, game_info in games_data.items():
-            installed = game_info['name'] in installed_games and game_info['version'] in installed_games[game_info['name']]
-            card = GameCard(
-                self.scrollable_frame,
-                game_info,
-                self.queue_download,
-                self.launch_game,
-                self.uninstall_game,  # Новая функция удаления
-                installed
-            )
-            card.pack(fill='x', pady=8)
+        self._games = list(games_data.values())
+        self._search_texts = [f"{game_info['name']} {game_info['description']}".lower()
+                              for game_info in self._games]
+        # Описания могли смениться — высоту строки _render_cards перемерит
+        self._row_height = 0
+        # Сами карточки обновит _render_cards — только для видимых строк
+        self._apply_search()
 
     def queue_download(self, game_data: Dict):
         if game_data['name'] not in self.active_downloads:
             download_url = f"http://biggod.pythonanywhere.com/{game_data['download_path'].lstrip('/')}"
-            print(f"DEBUG: Full download URL: {download_url}")
-            game_data_with_full_url = game_data.copy()
-            game_data_with_full_url['download_url'] = download_url
-            
-            self.download_queue.append(game_data_with_full_url)
+            logging.debug("Full download URL: %s", download_url)
+            # URL идёт рядом с данными игры, без копирования словаря
+            self.download_queue.append((game_data, download_url))
             self.process_download_queue()
     
     def process_download_queue(self):
         if not self.download_queue or len(self.active_downloads) >= 3:
             return
         
-        game_data = self.download_queue.pop(0)
+        game_data, download_url = self.download_queue.pop(0)
         item_id = self.downloads_tree.insert('', 'end', values=(
             game_data['name'],
             game_data['version'],
@@ -582,19 +1527,30 @@ class PintuxxGameLauncher:
         worker = DownloadWorker(
             self.game_manager,
             game_data,
+            download_url,
             self.game_manager.install_dir,
             lambda progress: self.update_progress(item_id, progress),
-            lambda success, data: self.download_completed(success, data, item_id)
+            lambda success, data: self.root.after(0, self.download_completed, success, data, item_id)
         )
         
         self.active_downloads[game_data['name']] = worker
         worker.start()
 
     def update_progress(self, item_id: str, progress: int):
-        self.downloads_tree.set(item_id, 'progress', f'{progress}%')
-        self.downloads_tree.set(item_id, 'status', 'Downloading')
+        # Вызывается из потока загрузки: только запоминаем, перерисовка — в _flush_progress
+        self._pending_progress[item_id] = progress
+
+    def _flush_progress(self):
+        """Применить накопленный прогресс загрузок одним проходом"""
+        while self._pending_progress:
+            item_id, progress = self._pending_progress.popitem()
+            self.downloads_tree.set(item_id, 'progress', f'{progress}%')
+            self.downloads_tree.set(item_id, 'status', 'Downloading')
+        self.root.after(PROGRESS_FLUSH_MS, self._flush_progress)
 
     def download_completed(self, success: bool, game_data: Dict, item_id: str):
+        # Запоздалый прогресс не должен перетереть итоговый статус
+        self._pending_progress.pop(item_id, None)
         status = '✅ Completed' if success else '❌ Failed'
         self.downloads_tree.set(item_id, 'status', status)
         
@@ -605,16 +1561,29 @@ class PintuxxGameLauncher:
         self.load_games()
 
     def launch_game(self, game_data: Dict):
-        game_path = self.game_manager.install_dir / game_data['name'] / game_data['version']
-        exe_files = list(game_path.glob('*.exe'))
+        if (game_data['name'], game_data['version']) in self._uninstalling:
+            return  # Файлы уже удаляются
+        future = self._io_pool.submit(self._start_game, game_data)
+        future.add_done_callback(lambda f: self.root.after(0, self._on_game_started, f, game_data))
+
+    def _start_game(self, game_data: Dict) -> bool:
+        """Найти и запустить exe игры (в фоновом потоке)"""
+        exe_file = self.game_manager.get_executable(game_data['name'], game_data['version'])
+        if exe_file is None:
+            return False
+        subprocess.Popen([str(exe_file)], cwd=exe_file.parent)
+        return True
+
+    def _on_game_started(self, future, game_data: Dict):
+        try:
+            started = future.result()
+        except Exception as e:
+            logging.error(f"Failed to launch game: {e}")
+            messagebox.showerror("Error", "Failed to launch game")
+            return
         
-        if exe_files:
-            try:
-                subprocess.Popen([str(exe_files[0])], cwd=game_path)
-                logging.info(f"Launched game: {game_data['name']}")
-            except Exception as e:
-                logging.error(f"Failed to launch game: {e}")
-                messagebox.showerror("Error", "Failed to launch game")
+        if started:
+            logging.info(f"Launched game: {game_data['name']}")
         else:
             messagebox.showwarning("Warning", "No executable found")
 
@@ -622,6 +1591,8 @@ class PintuxxGameLauncher:
         """Удалить игру с устройства"""
         game_name = game_data['name']
         version = game_data['version']
+        if (game_name, version) in self._uninstalling:
+            return  # Игра уже удаляется
         
         confirm = messagebox.askyesno(
             "Confirm Uninstall",
@@ -630,13 +1601,34 @@ class PintuxxGameLauncher:
         )
         
         if confirm:
-            success = self.game_manager.uninstall_game(game_name, version)
-            if success:
-                messagebox.showinfo("Success", f"{game_name} {version} has been uninstalled!")
-                self.load_games()  # Обновляем список игр
-                logging.info(f"User uninstalled {game_name} {version}")
-            else:
-                messagebox.showerror("Error", f"Failed to uninstall {game_name}")
+            self._uninstalling.add((game_name, version))
+            self._show_busy(f"🗑️ Uninstalling {game_name} {version}...")
+            future = self._io_pool.submit(self.game_manager.uninstall_game, game_name, version)
+            future.add_done_callback(lambda f: self.root.after(0, self._on_uninstalled, f, game_name, version))
+
+    def _on_uninstalled(self, future, game_name: str, version: str):
+        self._uninstalling.discard((game_name, version))
+        self._hide_busy()
+        # GameManager.uninstall_game сам перехватывает ошибки и возвращает False
+        if future.result():
+            messagebox.showinfo("Success", f"{game_name} {version} has been uninstalled!")
+            self.load_games()  # Обновляем список игр
+            logging.info(f"User uninstalled {game_name} {version}")
+        else:
+            messagebox.showerror("Error", f"Failed to uninstall {game_name}")
+
+    def _show_busy(self, text: str):
+        self._busy_count += 1
+        self.busy_label.config(text=text)
+        if self._busy_count == 1:
+            self.busy_frame.pack(side='right')
+            self.busy_bar.start(15)
+
+    def _hide_busy(self):
+        self._busy_count -= 1
+        if self._busy_count == 0:
+            self.busy_bar.stop()
+            self.busy_frame.pack_forget()
 
     def change_install_dir(self):
         from tkinter import filedialog
@@ -700,130 +1692,210 @@ Update your games and enjoy the new experience! 🎮
 
     def run(self):
         self.root.mainloop()
+        self._io_pool.shutdown(wait=False)
+        self.server_handler.close()
+        self.update_handler.close()
 
     def check_for_updates(self):
-        """Проверить обновления лаунчера"""
+        """Проверить обновления лаунчера (запрос с повторами — в фоне, чтобы окно не замирало)"""
+        threading.Thread(target=self._check_for_updates_worker, daemon=True).start()
+    
+    def _check_for_updates_worker(self):
         try:
-            handler = SecureRequestHandler(self.update_url, verify_ssl=False)
-            status, response = handler._make_request('')
+            status, response = self.update_handler._make_request('')
             
             if status == 200:
                 update_info = json.loads(response.decode('utf-8'))
-                latest_version = update_info.get('version')
-                
-                if self._compare_versions(self.launcher_version, latest_version) < 0:
-                    self._ask_for_update(update_info)
-                else:
-                    messagebox.showinfo("Updates", "🎉 You have the latest version!")
+                newer = self._compare_versions(update_info.get('version')) < 0
+                # Виджеты трогаем только из основного потока
+                self.root.after(0, self._on_update_checked, update_info, newer)
             else:
-                messagebox.showerror("Update Error", "Failed to check for updates")
+                self.root.after(0, messagebox.showerror, "Update Error", "Failed to check for updates")
         except Exception as e:
             logging.error(f"Update check error: {e}")
-            messagebox.showerror("Update Error", f"Failed to check for updates: {e}")
+            self.root.after(0, messagebox.showerror, "Update Error", f"Failed to check for updates: {e}")
     
-    def _compare_versions(self, current: str, latest: str) -> int:
-        """Сравнить версии (возвращает -1 если current < latest)"""
-        current_parts = list(map(int, current.split('.')))
-        latest_parts = list(map(int, latest.split('.')))
-        
-        for i in range(max(len(current_parts), len(latest_parts))):
-            current_val = current_parts[i] if i < len(current_parts) else 0
-            latest_val = latest_parts[i] if i < len(latest_parts) else 0
-            
-            if current_val < latest_val:
-                return -1
-            elif current_val > latest_val:
-                return 1
-        return 0
+    def _on_update_checked(self, update_info: Dict, newer: bool):
+        if newer:
+            self._ask_for_update(update_info)
+        else:
+            messagebox.showinfo("Updates", "🎉 You have the latest version!")
     
-    def _ask_for_update(self, update_info: Dict):
-        """Спросить пользователя об обновлении"""
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _parse_version(version: str) -> Tuple[int, ...]:
+        """Разобрать версию в кортеж без хвостовых нулей, чтобы 1.1 == 1.1.0"""
+        parts = [int(x) for x in version.split('.')]
+        while parts and parts[-1] == 0:
+            parts.pop()
+        return tuple(parts)
+
+    def _compare_versions(self, latest: str) -> int:
+        """Сравнить с версией лаунчера (возвращает -1 если текущая < latest)"""
+        current = self._launcher_version_tuple
+        latest = self._parse_version(latest)
+        return (current > latest) - (current < latest)
+    
+    def _describe_update(self, update_info: Dict) -> str:
+        """Текст предложения обновиться"""
         latest_version = update_info.get('version', 'Unknown')
         changes = update_info.get('changelog', 'No changelog available')
-        download_url = update_info.get('download_url')
-        file_size = update_info.get('file_size', 0)
-        
-        message = (
+        return (
             f"🎉 New version {latest_version} is available!\n\n"
             f"Current version: {self.launcher_version}\n"
-            f"File size: {file_size} MB\n\n"
+            f"File size: {_format_size(update_info.get('file_size', 0))}\n\n"
             f"Changes:\n{changes}\n\n"
             "Do you want to update now?"
         )
-        
-        if messagebox.askyesno("Update Available", message):
-            self._perform_update(download_url, update_info)
+
+    def _ask_for_update(self, update_info: Dict):
+        """Спросить пользователя об обновлении"""
+        if messagebox.askyesno("Update Available", self._describe_update(update_info)):
+            self._perform_update(update_info.get('download_url'), update_info)
     
     def _perform_update(self, download_url: str, update_info: Dict):
-        """Выполнить обновление"""
+        """Выполнить обновление: загрузка в фоне, прогресс — строкой в списке загрузок"""
+        if self._update_thread is not None and self._update_thread.is_alive():
+            return  # Обновление уже качается
+        
+        item_id = self.downloads_tree.insert('', 'end', values=(
+            'Pintuxx Launcher',
+            update_info.get('version', ''),
+            '0%',
+            'Starting'
+        ))
+        self._update_thread = threading.Thread(target=self._download_update,
+                                               args=(download_url, update_info, item_id), daemon=True)
+        self._update_thread.start()
+
+    def _download_update(self, download_url: str, update_info: Dict, item_id: str):
+        """Скачать и проверить новую версию лаунчера (в фоновом потоке)"""
+        temp_dir = self._update_dir
+        temp_file = temp_dir / "launcher_new.exe"
+        progress = lambda value: self.update_progress(item_id, value)
+        error = None
+        
         try:
-            temp_dir = Path("temp_update")
+            # По http файл могли подменить в пути, и CERT_PINS к нему не применим
+            if urllib.parse.urlsplit(download_url or '').scheme != 'https':
+                raise ValueError(f"refusing to download update over insecure URL: {download_url}")
             temp_dir.mkdir(exist_ok=True)
+            # Остаток прошлой попытки может быть от другой версии — не докачиваем его
+            if temp_file.exists():
+                temp_file.unlink()
             
-            temp_file = temp_dir / "launcher_new.exe"
-            
-            handler = SecureRequestHandler(download_url, verify_ssl=False)
-            status, response = handler._make_request('')
-            
-            if status == 200:
-                with open(temp_file, 'wb') as f:
-                    f.write(response)
-                
-                expected_checksum = update_info.get('checksum')
-                if expected_checksum and not self._verify_file_checksum(temp_file, expected_checksum):
-                    messagebox.showerror("Update Error", "Checksum verification failed!")
-                    temp_file.unlink()
-                    return
-                
-                self._create_update_script(temp_file)
-                
-                messagebox.showinfo("Update", "Update downloaded! Launcher will restart to apply update.")
-                self.root.quit()
-                
+            # Тот же потоковый загрузчик, что и для игр: запись и хеш за один проход
+            checksum, checksum_algo = pick_checksum(update_info, optional=True)
+            # SHA-256 для подписи считается тем же проходом, что и контрольная сумма
+            digests = {'sha256': None} if UPDATE_PUBLIC_KEY else None
+            if update_info.get('chunk_checksums'):
+                # Куски качаются параллельно и проверяются по отдельности
+                downloaded = self.game_manager._download_chunked(
+                    download_url, temp_file, int(update_info.get('chunk_size', 0)),
+                    update_info['chunk_checksums'], checksum, checksum_algo,
+                    update_info.get('chunk_checksum_algo', 'sha256'), progress, digests=digests)
             else:
-                messagebox.showerror("Update Error", "Failed to download update")
-                
+                downloaded = self.game_manager._download_file(download_url, temp_file, checksum, progress,
+                                                              checksum_algo, digests=digests)
+            # Подпись доказывает, что файл выпустили мы, а не только что он дошёл целым
+            if downloaded and digests is not None and not verify_signature(digests['sha256'],
+                                                                           update_info.get('signature')):
+                logging.error("Update signature verification failed")
+                downloaded = False
+            if not downloaded:
+                if temp_file.exists():
+                    temp_file.unlink()
+                error = "Failed to download or verify update"
         except Exception as e:
             logging.error(f"Update error: {e}")
-            messagebox.showerror("Update Error", f"Update failed: {e}")
-    
-    def _verify_file_checksum(self, file_path: Path, expected_checksum: str) -> bool:
-        """Проверить контрольную сумму файла"""
-        hash_md5 = hashlib.md5()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest() == expected_checksum
-    
-    def _create_update_script(self, new_launcher_path: Path):
-        """Создать скрипт для обновления (работает для Windows)"""
-        current_exe = Path(sys.argv[0]).absolute()
-        new_exe = new_launcher_path.absolute()
+            error = f"Update failed: {e}"
         
-        bat_content = f"""@echo off
-echo Updating Pintuxx Game Launcher...
-timeout /t 2 /nobreak >nul
-
-:wait
-tasklist /fi "imagename eq {current_exe.name}" | find "{current_exe.name}" >nul
-if not errorlevel 1 (
-    timeout /t 1 /nobreak >nul
-    goto wait
-)
+        # Виджеты трогаем только из основного потока
+        self.root.after(0, self._update_downloaded, temp_file, item_id, error)
 
-copy /Y "{new_exe}" "{current_exe}" >nul
-start "" "{current_exe}"
-del "{new_exe}" >nul
-rd "{new_exe.parent}" >nul 2>&1
-del "%~f0" >nul
-"""
+    def _update_downloaded(self, temp_file: Path, item_id: str, error: Optional[str]):
+        self._pending_progress.pop(item_id, None)
+        if error is None:
+            try:
+                self._start_update_helper(temp_file)
+            except Exception as e:
+                logging.error(f"Update error: {e}")
+                error = f"Update failed: {e}"
         
-        bat_file = Path("update_launcher.bat")
-        with open(bat_file, 'w') as f:
-            f.write(bat_content)
+        if error is not None:
+            self.downloads_tree.set(item_id, 'status', '❌ Failed')
+            messagebox.showerror("Update Error", error)
+            return
         
-        subprocess.Popen([str(bat_file)], shell=True)
+        self.downloads_tree.set(item_id, 'progress', '100%')
+        self.downloads_tree.set(item_id, 'status', '✅ Completed')
+        messagebox.showinfo("Update", "Update downloaded! Launcher will restart to apply update.")
+        self.root.quit()
+
+    def _start_update_helper(self, new_launcher_path: Path):
+        """Запустить скачанный лаунчер в режиме установки обновления (без bat и cmd.exe)"""
+        current_exe = Path(sys.argv[0]).absolute()
+        new_exe = new_launcher_path.absolute()
+        # Новый exe дождётся выхода этого процесса, встанет на место старого и перезапустится
+        subprocess.Popen([str(new_exe), '--apply-update', str(os.getpid()), str(current_exe)],
+                         cwd=str(current_exe.parent))
+
+def _wait_for_process(pid: int) -> None:
+    """Дождаться завершения процесса: на Windows — по событию ядра, иначе опросом"""
+    if os.name == 'nt':
+        import ctypes
+        SYNCHRONIZE = 0x00100000
+        INFINITE = 0xFFFFFFFF
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(SYNCHRONIZE, False, pid)
+        if handle:  # Нет дескриптора — процесс уже завершился
+            kernel32.WaitForSingleObject(handle, INFINITE)
+            kernel32.CloseHandle(handle)
+        return
+    while True:
+        try:
+            os.kill(pid, 0)
+        except OSError:
+            return
+        time.sleep(0.1)
+
+def apply_update(pid: int, target: Path) -> None:
+    """Режим --apply-update: заменить старый лаунчер этим файлом и запустить его"""
+    source = Path(sys.executable if getattr(sys, 'frozen', False) else sys.argv[0]).absolute()
+    _wait_for_process(pid)
+    
+    # Переименование на том же томе атомарно и не копирует байты;
+    # сразу после выхода старый exe ещё может быть занят антивирусом — пробуем несколько раз
+    for _ in range(10):
+        try:
+            os.replace(source, target)
+            break
+        except PermissionError:
+            time.sleep(0.5)
+        except OSError:
+            # Другой том (EXDEV) — переименовать нельзя, копируем, как это делал copy /Y
+            try:
+                shutil.copy2(source, target)
+            except OSError as e:
+                logging.error(f"Failed to replace {target}: {e}")
+                target = source
+                break
+            try:
+                source.unlink()
+            except OSError:
+                pass  # Остаток в temp_update уберёт _purge_stale_update
+            break
+    else:
+        target = source  # Заменить не вышло — запускаем новую версию с её места
+    
+    if os.name == 'nt':
+        os.startfile(str(target))
+    else:
+        subprocess.Popen([str(target)], cwd=str(target.parent))
 
 if __name__ == "__main__":
-    launcher = PintuxxGameLauncher()
-    launcher.run()
+    if len(sys.argv) == 4 and sys.argv[1] == '--apply-update':
+        apply_update(int(sys.argv[2]), Path(sys.argv[3]))
+    else:
+        launcher = PintuxxGameLauncher()
+        launcher.run()